@@ -1,8 +1,24 @@
+import contextlib
+import csv
+import functools
+import hashlib
+import inspect
+import json
 import logging
+import logging.handlers
+import os
+import sys
 import time
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
 from pathlib import Path
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import ClassVar, Optional
 
 
 # BASE_DIR = project root (two levels above this file: src/etl/ -> src/ -> <root>)
@@ -12,6 +28,26 @@ BASE_DIR = Path(__file__).parents[2]
 LOG_DIR = BASE_DIR / "src" / "logs"
 LOG_DIR.mkdir(exist_ok=True)
 
+# Parquet codec per storage tier (env LAKEHOUSE_STORAGE_TIER). On NVMe /
+# RAM disks decompressing costs more than the I/O it saves; anything else
+# keeps zstd.
+STORAGE_TIER_ENV = "LAKEHOUSE_STORAGE_TIER"
+PARQUET_COMPRESSION = {"fast": "none"}
+DEFAULT_PARQUET_COMPRESSION = "zstd"
+ZSTD_LEVEL = 3  # near-Snappy write speed, noticeably smaller files
+
+
+class _BufferedFileHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that also closes its target file handler on close()."""
+
+    def close(self) -> None:
+        target = self.target
+        try:
+            super().close()
+        finally:
+            if target is not None:
+                target.close()
+
 
 def get_logger(log_file: str) -> logging.Logger:
     """
@@ -20,6 +56,7 @@ def get_logger(log_file: str) -> logging.Logger:
     """
     logger = logging.getLogger(log_file)
     logger.setLevel(logging.INFO)
+    logger.propagate = False
 
     # Avoid duplicate handlers if logger already exists
     if logger.handlers:
@@ -27,10 +64,14 @@ def get_logger(log_file: str) -> logging.Logger:
 
     formatter = logging.Formatter("%(asctime)s  %(levelname)-8s  %(message)s")
 
-    # File handler
+    # File handler, buffered: lines are written in batches (immediately
+    # from ERROR on) instead of one write() per record. Transformers flush
+    # at the end of run().
     fh = logging.FileHandler(LOG_DIR / log_file, mode="w")
     fh.setFormatter(formatter)
-    logger.addHandler(fh)
+    logger.addHandler(
+        _BufferedFileHandler(capacity=1024, flushLevel=logging.ERROR, target=fh)
+    )
 
     # Console handler
     sh = logging.StreamHandler()
@@ -53,6 +94,10 @@ class BaseTransformer(ABC):
     """
 
     _output_filename: str  # Must be set by every concrete subclass
+    _row_group_size = 128 * 1024  # rows per Parquet row group (_save_parquet)
+    # {column: Parquet encoding} overriding dictionary encoding for those
+    # columns (e.g. "DELTA_BINARY_PACKED" for increasing integer ids)
+    _column_encoding: ClassVar[dict[str, str]] = {}
 
     def __init__(
         self,
@@ -92,6 +137,11 @@ class BaseTransformer(ABC):
     #  Shared methods (used by all transformers)                         #
     # ------------------------------------------------------------------ #
 
+    def _flush_logs(self) -> None:
+        """Write out records buffered by the file handler (see get_logger)."""
+        for handler in self.logger.handlers:
+            handler.flush()
+
     def _check_output_filename(self) -> None:
         """Raise early if _output_filename was not set by the subclass."""
         if not getattr(self, "_output_filename", None):
@@ -100,9 +150,28 @@ class BaseTransformer(ABC):
                 "(as class attribute or in __init__)"
             )
 
-    def load_bronze(self) -> pd.DataFrame:
+    def _bronze_header(self) -> list[str]:
+        """Column names from the first line of the Bronze CSV (or its Parquet schema)."""
+        if self.bronze_path.suffix == ".parquet":
+            return pq.read_schema(self.bronze_path).names
+        with open(self.bronze_path, newline="", encoding="utf-8-sig") as f:
+            return next(csv.reader(f), [])
+
+    def load_bronze(self, dtype: dict = None, columns: list = None) -> pd.DataFrame:
         """Load raw CSV from Bronze layer into a Pandas DataFrame.
 
+        Parsed with pyarrow.csv (multi-threaded block parsing); the Arrow
+        buffers are released column by column while converting to pandas.
+        Falls back to pd.read_csv if pyarrow cannot convert a column.
+        Bronze files written as Parquet (DataSplitter output_format="parquet")
+        are read with pyarrow.parquet instead.
+
+        Args:
+            dtype:   Optional {Bronze column: dtype} applied at load time,
+                     so those columns need no cast afterwards.
+            columns: Optional Bronze columns to read (projection pushdown);
+                     all other columns are never converted.
+
         Raises:
             FileNotFoundError: If bronze_path is None or does not exist.
         """
@@ -111,7 +180,27 @@ class BaseTransformer(ABC):
         if not self.bronze_path.exists():
             raise FileNotFoundError(f"Bronze file not found: {self.bronze_path}")
 
-        df = pd.read_csv(self.bronze_path)
+        # Nullable ints may be exported as "5.0" — let Arrow infer and cast below
+        convert_options = pa_csv.ConvertOptions(
+            include_columns=columns or [],
+            strings_can_be_null=True,
+        )
+
+        try:
+            if self.bronze_path.suffix == ".parquet":
+                table = pq.read_table(self.bronze_path, columns=columns)
+            else:
+                table = pa_csv.read_csv(self.bronze_path, convert_options=convert_options)
+            df = table.to_pandas(split_blocks=True, self_destruct=True)
+            del table
+        except pa.ArrowInvalid as e:
+            self.logger.warning(f"[LOAD] pyarrow parser failed ({e}) — retrying with pd.read_csv")
+            df = pd.read_csv(self.bronze_path, usecols=columns)
+            if columns:
+                df = df[columns]  # usecols keeps file order
+
+        if dtype:
+            df = df.astype(dtype, copy=False)
 
         self.logger.info(f"[LOAD] Loaded: {self.bronze_path.name}")
         self.logger.info(f"[LOAD] Shape: {df.shape[0]} rows x {df.shape[1]} columns")
@@ -133,27 +222,86 @@ class BaseTransformer(ABC):
         return df
 
 
-    def _drop_empty_columns(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Drop columns where ALL values are NaN."""
-        before = df.shape[1]
-        df = df.dropna(axis=1, how="all")
-        dropped = before - df.shape[1]
-
-        self.logger.info(f"[TRANSFORM] Dropped {dropped} empty column(s) | Remaining: {df.shape[1]}")
+    def _drop_empty_columns(
+        self, df: pd.DataFrame, redundant: frozenset = frozenset()
+    ) -> pd.DataFrame:
+        """
+        Drop columns where ALL values are NaN, plus any *redundant* labels,
+        in a single projection. If nothing is dropped, returns a shallow
+        copy (data shared, no copying), so later in-place steps never
+        reach the caller's frame.
+        """
+        non_null = df.count()
+        empty = [col for col, count in non_null.items() if not count and col not in redundant]
+        dropped = [col for col in df.columns if col in redundant]
+
+        if empty or dropped:
+            skip = set(empty).union(dropped)
+            df = df[[col for col in df.columns if col not in skip]]
+        else:
+            df = df.copy(deep=False)
+        if dropped:
+            self.logger.info(f"[TRANSFORM] Dropped redundant column(s): {', '.join(dropped)}")
+        self.logger.info(f"[TRANSFORM] Dropped {len(empty)} empty column(s) | Remaining: {df.shape[1]}")
 
         return df
     
-    def _to_datetime(self, series: pd.Series, fmt: str = None) -> pd.Series:
+    def _to_datetime(self, series: pd.Series, fmt: str = "ISO8601") -> pd.Series:
         """Cast to datetime64[ns] consistently across all transformers.
 
         Args:
             series: Column to convert.
-            fmt:    Optional strftime format string.  When *None* the format
-                    is inferred automatically — for small Series Pandas may
-                    fall back to per-element parsing (slow + UserWarning).
-                    Pass an explicit format to avoid that.
+            fmt:    strftime format string. Defaults to "ISO8601", which
+                    accepts both date-only and date-time values. Pass *None*
+                    to let Pandas infer the format (slower).
+
+        Columns that already arrive as datetime64 (e.g. timestamps inferred
+        by the CSV reader) are only normalised to [ns], not re-parsed.
+        ISO8601 strings are parsed by Arrow's C++ cast first; if any value
+        does not fit (e.g. the 9999-12-31 ValidTo sentinel, garbage), the
+        whole column goes through pd.to_datetime(errors="coerce") instead.
         """
-        return pd.to_datetime(series, format=fmt, errors="coerce").astype("datetime64[ns]")
+        if pd.api.types.is_datetime64_any_dtype(series):
+            return series.astype("datetime64[ns]")
+        if fmt == "ISO8601":
+            try:
+                parsed = pc.cast(pa.array(series, from_pandas=True), pa.timestamp("ns"))
+                return pd.Series(
+                    parsed.to_numpy(zero_copy_only=False), index=series.index, name=series.name
+                )
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+                pass
+        return pd.to_datetime(series, format=fmt, errors="coerce", cache=True).astype("datetime64[ns]")
+
+    def _cast_datetime_columns(
+        self, df: pd.DataFrame, columns: list, fmt: str = "ISO8601"
+    ) -> pd.DataFrame:
+        """Cast several columns to datetime64[ns] with a single parse.
+
+        The columns are stacked into one Series, so cache=True de-duplicates
+        timestamps shared across columns, then split back in place.
+        """
+        if not columns:
+            return df
+
+        # Already-parsed columns skip the string parser entirely
+        to_parse = []
+        for col in columns:
+            if pd.api.types.is_datetime64_any_dtype(df[col]):
+                df[col] = self._to_datetime(df[col])
+            else:
+                to_parse.append(col)
+
+        if to_parse:
+            n_rows = len(df)
+            stacked = pd.concat([df[col] for col in to_parse], ignore_index=True)
+            parsed = self._to_datetime(stacked, fmt).to_numpy()
+
+            for i, col in enumerate(to_parse):
+                df[col] = parsed[i * n_rows:(i + 1) * n_rows]
+
+        self.logger.info(f"[TRANSFORM] Cast to datetime: {', '.join(columns)}")
+        return df
 
     def _validate_nulls(
         self,
@@ -172,46 +320,120 @@ class BaseTransformer(ABC):
             The original DataFrame (unchanged).
         """
         available = set(df.columns)
+        checked = [
+            col for col in dict.fromkeys([*(expected_nulls or {}), *(required_columns or [])])
+            if col in available
+        ]
+
+        # One NumPy reduction over the stacked null mask counts every
+        # checked column; the loops in _report_nulls only read the result.
+        null_counts = self._count_nulls(df[checked]) if checked else pd.Series(dtype="int64")
+
+        self._report_nulls(null_counts, expected_nulls, required_columns)
+        return df
+
+    @staticmethod
+    def _count_nulls(df: pd.DataFrame) -> pd.Series:
+        """Null count per column via np.count_nonzero over the 2D isna() mask."""
+        return pd.Series(
+            np.count_nonzero(df.isna().to_numpy(), axis=0), index=df.columns, dtype="int64"
+        )
 
+    def _report_nulls(
+        self,
+        null_counts: pd.Series,
+        expected_nulls: dict = None,
+        required_columns: list = None,
+    ) -> None:
+        """
+        Log precomputed null counts (index = available columns).
+
+        Shared by _validate_nulls() and the streaming Silver run, which
+        accumulates the counts across chunks.
+        """
+        available = set(null_counts.index)
+
+        # Aggregated logging: one INFO line per category, warnings per problem
         if expected_nulls:
+            expected_summary = []
             for col, reason in expected_nulls.items():
                 if col not in available:
                     self.logger.warning(f"[NULLS] Column '{col}' not in DataFrame — skipped")
                     continue
-                null_count = df[col].isna().sum()
-                self.logger.info(
-                    f"[NULLS] {col}: {null_count} null(s) -> expected ({reason})"
-                )
+                expected_summary.append(f"{col}={null_counts[col]} ({reason})")
+            if expected_summary and self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"[NULLS] Expected null(s): {', '.join(expected_summary)}")
 
         if required_columns:
+            ok_columns = []
             for col in required_columns:
                 if col not in available:
                     self.logger.warning(f"[NULLS] Required column '{col}' not in DataFrame!")
                     continue
-                null_count = df[col].isna().sum()
+                null_count = null_counts[col]
                 if null_count > 0:
                     self.logger.warning(
                         f"[NULLS] Unexpected nulls in {col}: {null_count}"
                     )
                 else:
-                    self.logger.info(f"[NULLS] {col}: OK (0 nulls)")
-
-        return df
+                    ok_columns.append(col)
+            if ok_columns and self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"[NULLS] OK (0 nulls): {', '.join(ok_columns)}")
 
     # ------------------------------------------------------------------ #
     #  File output                                                       #
     # ------------------------------------------------------------------ #
 
+    def _parquet_options(self, schema: pa.Schema = None) -> dict:
+        """ParquetWriter keyword arguments shared by every Silver/Gold write.
+
+        Given the Arrow *schema* being written, _column_encoding is applied
+        to the columns it contains; all other columns stay dictionary-encoded.
+        """
+        tier = os.environ.get(STORAGE_TIER_ENV, "").strip().lower()
+        compression = PARQUET_COMPRESSION.get(tier, DEFAULT_PARQUET_COMPRESSION)
+        options = {
+            "compression": compression,
+            "compression_level": ZSTD_LEVEL if compression == "zstd" else None,
+            "use_dictionary": True,
+            "write_statistics": True,
+        }
+
+        encodings = {
+            name: self._column_encoding[name]
+            for name in (schema.names if schema is not None else ())
+            if name in self._column_encoding
+        }
+        if encodings:
+            options["column_encoding"] = encodings
+            options["use_dictionary"] = [name for name in schema.names if name not in encodings]
+        return options
+
     def _save_parquet(
         self, df: pd.DataFrame, output_dir: Path, filename: str, layer: str
     ) -> None:
-        """Generic save: write DataFrame as Parquet to *output_dir*/*filename*."""
+        """
+        Generic save: write DataFrame as Parquet to *output_dir*/*filename*.
+
+        Rows are converted to Arrow and written one row group
+        (_row_group_size rows) at a time, so only one slice is held as an
+        Arrow table at once.
+        """
         if df.empty:
             self.logger.warning(f"[SAVE] DataFrame is empty — skipping {layer} save")
             return
 
         output_path = output_dir / filename
-        df.to_parquet(output_path, index=False)
+        schema = pa.Schema.from_pandas(df, preserve_index=False)
+        row_group_size = self._row_group_size
+
+        with pq.ParquetWriter(output_path, schema, **self._parquet_options(schema)) as writer:
+            for start in range(0, len(df), row_group_size):
+                chunk = df.iloc[start:start + row_group_size]
+                writer.write_table(
+                    pa.Table.from_pandas(chunk, schema=schema, preserve_index=False),
+                    row_group_size=row_group_size,
+                )
 
         self.logger.info(f"[SAVE] Saved to {layer}: {output_path}")
         self.logger.info(f"[SAVE] Shape: {df.shape[0]} rows x {df.shape[1]} columns")
@@ -241,6 +463,36 @@ class BaseTransformer(ABC):
 # ====================================================================== #
 
 
+@dataclass(frozen=True, slots=True)
+class TransformerSchema:
+    """
+    Static per-class metadata of a Silver transformer, built once by
+    SilverTransformer._schema() and consumed by all hooks.
+
+    Args:
+        rename_map:     Bronze name -> snake_case name
+        bronze_dtypes:  {Bronze name: dtype} pushed into load_bronze()
+        bronze_dates:   Bronze names of date_cols
+        parsed_cols:    {Bronze column: precomputed datetime column} read
+                        in place of the string column
+        drop_cols:      Bronze columns projected away before the first step
+        date_cols:      snake_case columns cast to datetime64[ns]
+        int_cols:       snake_case columns cast to nullable Int64
+        required:       columns that must not contain any NaN
+        expected_nulls: {column: reason} — NaN values are expected here
+    """
+
+    rename_map: dict[str, str]
+    bronze_dtypes: dict[str, str]
+    bronze_dates: tuple[str, ...]
+    parsed_cols: dict[str, str]
+    drop_cols: frozenset[str]
+    date_cols: tuple[str, ...]
+    int_cols: tuple[str, ...]
+    required: tuple[str, ...]
+    expected_nulls: dict[str, str]
+
+
 class SilverTransformer(BaseTransformer):
     """
     Base class for Bronze -> Silver transformers.
@@ -254,8 +506,37 @@ class SilverTransformer(BaseTransformer):
       drop_empty -> rename -> cast -> handle_nulls
 
     Override transform() only if you need a fundamentally different pipeline.
+
+    Subclasses may declare _COLUMN_MAPPING (Bronze name -> snake_case name)
+    instead of overriding _rename_columns(), and _DROP_COLUMNS (Bronze names)
+    for redundant columns or columns that are always empty in the WWI
+    export; the CSV reader never loads them.
+    _PARSED_COLUMNS maps a Bronze date column to the datetime column the
+    Bronze stage already derived from it (e.g. "LastEditedWhen_parsed");
+    the precomputed column is read under the original name instead.
+
+    _DATETIME_COLUMNS and _NULLABLE_INT_COLUMNS (snake_case names) are cast
+    by the default _cast_dtypes(); the Int64 columns are already pushed into
+    the CSV reader by load_bronze(). _REQUIRED_COLUMNS and _EXPECTED_NULLS
+    drive the default _handle_nulls().
+
+    The class attributes are collected once per class into a
+    TransformerSchema by _schema().
     """
 
+    _COLUMN_MAPPING: ClassVar[dict[str, str]] = {}
+    _DROP_COLUMNS: ClassVar[frozenset[str]] = frozenset()
+    _PARSED_COLUMNS: ClassVar[dict[str, str]] = {}
+    _DATETIME_COLUMNS: ClassVar[tuple[str, ...]] = ()
+    _NULLABLE_INT_COLUMNS: ClassVar[tuple[str, ...]] = ()
+    _REQUIRED_COLUMNS: ClassVar[tuple[str, ...]] = ()
+    _EXPECTED_NULLS: ClassVar[dict[str, str]] = {}
+
+    # Bytes per Bronze CSV block for the streaming run (None: load in memory).
+    # Transformers for the large Bronze files (sales, supplier
+    # transactions) set 32 MB blocks.
+    _stream_block_size: ClassVar[Optional[int]] = None
+
     def __init__(self, bronze_path: Path, silver_path: Path, log_file: str):
         super().__init__(
             log_file=log_file,
@@ -263,22 +544,119 @@ class SilverTransformer(BaseTransformer):
             silver_path=silver_path,
         )
 
+    @classmethod
+    @functools.cache
+    def _schema(cls) -> TransformerSchema:
+        """Collect the class-level column metadata once per class."""
+        bronze_names = {snake: raw for raw, snake in cls._COLUMN_MAPPING.items()}
+        return TransformerSchema(
+            rename_map=dict(cls._COLUMN_MAPPING),
+            bronze_dtypes={bronze_names.get(col, col): "Int64" for col in cls._NULLABLE_INT_COLUMNS},
+            bronze_dates=tuple(bronze_names.get(col, col) for col in cls._DATETIME_COLUMNS),
+            parsed_cols=dict(cls._PARSED_COLUMNS),
+            drop_cols=frozenset(cls._DROP_COLUMNS),
+            date_cols=tuple(cls._DATETIME_COLUMNS),
+            int_cols=tuple(cls._NULLABLE_INT_COLUMNS),
+            required=tuple(cls._REQUIRED_COLUMNS),
+            expected_nulls=dict(cls._EXPECTED_NULLS),
+        )
+
     # ------------------------------------------------------------------ #
     #  Hooks — override in subclasses                                    #
     # ------------------------------------------------------------------ #
 
     def _rename_columns(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Override to rename columns. Default: no-op."""
+        """Rename columns via _COLUMN_MAPPING. Default (empty mapping): no-op.
+
+        Builds the new labels in one pass and swaps the column Index
+        (no per-label validation as in df.rename). Returns a new frame
+        sharing the data; the caller's frame keeps its labels.
+        """
+        mapping = self._schema().rename_map
+        if not mapping:
+            return df
+        df = df.set_axis([mapping.get(col, col) for col in df.columns], axis=1, copy=False)
+        self.logger.info("[TRANSFORM] Columns renamed to snake_case")
         return df
 
     def _cast_dtypes(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Override to cast data types. Default: no-op."""
+        """Cast _DATETIME_COLUMNS / _NULLABLE_INT_COLUMNS."""
+        schema = self._schema()
+        df = self._cast_datetime_columns(df, list(schema.date_cols))
+
+        # Int64 casts in one astype, i.e. one new frame; a no-op for the
+        # columns load_bronze() already read as Int64.
+        casts = {col: "Int64" for col in schema.int_cols if df[col].dtype != "Int64"}
+        if casts:
+            df = df.astype(casts, copy=False)
+        if schema.int_cols:
+            self.logger.info(f"[TRANSFORM] Cast to Int64: {', '.join(schema.int_cols)}")
+
         return df
 
     def _handle_nulls(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Override to handle / validate null values. Default: no-op."""
+        """Validate _EXPECTED_NULLS / _REQUIRED_COLUMNS. Default (none): no-op."""
+        schema = self._schema()
+        if not schema.expected_nulls and not schema.required:
+            return df
+        return self._validate_nulls(df, schema.expected_nulls, list(schema.required))
+
+    def _drop_redundant_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Project away _DROP_COLUMNS from a streamed block. transform() does
+        this as part of _drop_empty_columns(); load_bronze() already skips
+        them.
+        """
+        drop_cols = self._schema().drop_cols
+        dropped = [col for col in df.columns if col in drop_cols]
+        if not dropped:
+            return df
+        df = df[[col for col in df.columns if col not in drop_cols]]
+        self.logger.info(f"[TRANSFORM] Dropped redundant column(s): {', '.join(dropped)}")
         return df
 
+    def _bronze_columns(self) -> Optional[list[str]]:
+        """
+        Bronze columns to read (None: all): the header without _DROP_COLUMNS,
+        with each _PARSED_COLUMNS source replaced in place by its
+        precomputed column if the file has one.
+        """
+        schema = self._schema()
+        if not schema.drop_cols and not schema.parsed_cols:
+            return None
+
+        header = self._bronze_header()
+        substitutes = {
+            source: parsed for source, parsed in schema.parsed_cols.items()
+            if source in header and parsed in header
+        }
+        skip = schema.drop_cols | set(substitutes.values())
+        if skip.isdisjoint(header):
+            return None
+        return [substitutes.get(col, col) for col in header if col not in skip or col in substitutes]
+
+    def _use_parsed_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Rename precomputed _PARSED_COLUMNS back to their source names."""
+        renames = {
+            parsed: source for source, parsed in self._schema().parsed_cols.items()
+            if parsed in df.columns and source not in df.columns
+        }
+        if not renames:
+            return df
+        self.logger.info(f"[LOAD] Using precomputed column(s): {', '.join(renames)}")
+        return df.rename(columns=renames, copy=False)
+
+    def load_bronze(self, dtype: dict = None, columns: list = None) -> pd.DataFrame:
+        """
+        Load Bronze CSV with _NULLABLE_INT_COLUMNS read directly as Int64
+        and _DROP_COLUMNS never read.
+        """
+        if dtype is None:
+            dtype = self._schema().bronze_dtypes or None
+        if columns is None:
+            columns = self._bronze_columns()
+        return self._use_parsed_columns(super().load_bronze(dtype=dtype, columns=columns))
+
     # ------------------------------------------------------------------ #
     #  Template Method                                                   #
     # ------------------------------------------------------------------ #
@@ -287,35 +665,222 @@ class SilverTransformer(BaseTransformer):
         """
         Template method: drop_empty -> rename -> cast -> handle_nulls.
         Override individual hooks for table-specific logic.
+
+        _DROP_COLUMNS left over (frames not from load_bronze()) are removed
+        in the same projection as the empty columns.
         """
         source = self.bronze_path.name if self.bronze_path else self.__class__.__name__
         self.logger.info(f"[TRANSFORM] Starting pipeline: {source}")
-        df = self._drop_empty_columns(df)
+        df = self._drop_empty_columns(df, redundant=self._schema().drop_cols)
         df = self._rename_columns(df)
         df = self._cast_dtypes(df)
         df = self._handle_nulls(df)
         self.logger.info(f"[TRANSFORM] Complete | Shape: {df.shape[0]} x {df.shape[1]}")
         return df
 
+    # ------------------------------------------------------------------ #
+    #  Streaming                                                         #
+    # ------------------------------------------------------------------ #
+
+    @contextlib.contextmanager
+    def _quiet_info(self):
+        """Drop INFO records of self.logger inside the block; warnings still pass."""
+        def above_info(record: logging.LogRecord) -> bool:
+            return record.levelno > logging.INFO
+
+        self.logger.addFilter(above_info)
+        try:
+            yield
+        finally:
+            self.logger.removeFilter(above_info)
+
+    def _stream_to_silver(self, output_path: Path) -> Optional[int]:
+        """
+        Bronze -> Silver in CSV blocks of _stream_block_size bytes.
+
+        Each block runs through drop_redundant -> rename -> cast and is
+        appended to the Parquet file, so peak memory is one block instead of
+        the whole frame. Null counts are accumulated across blocks for
+        _report_nulls(); columns that are empty in every block are removed
+        afterwards, row group by row group. The hooks log their steps for
+        the first block only, so each step is reported once per file.
+
+        Returns:
+            Rows written, or None if a block does not fit the schema of the
+            first one (the caller then falls back to the in-memory run).
+        """
+        schema = self._schema()
+        tmp_path = output_path.with_name(output_path.name + ".tmp")
+        self.logger.info(
+            f"[TRANSFORM] Streaming {self.bronze_path.name} "
+            f"in blocks of {self._stream_block_size / 2**20:.0f} MB"
+        )
+
+        # Date columns stay strings: Arrow fixes each column's type on the
+        # first block, and a later 9999-12-31 sentinel would not fit it.
+        reader = pa_csv.open_csv(
+            self.bronze_path,
+            read_options=pa_csv.ReadOptions(block_size=self._stream_block_size),
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=self._bronze_columns() or [],
+                column_types={col: pa.string() for col in schema.bronze_dates},
+                strings_can_be_null=True,
+            ),
+        )
+
+        writer = None
+        null_counts = None
+        n_rows = 0
+        # Whatever happens below (a hook raising, an interrupt), the writer
+        # is closed and no .tmp file is left behind in Silver.
+        try:
+            try:
+                for batch in reader:
+                    with self._quiet_info() if n_rows else contextlib.nullcontext():
+                        chunk = self._use_parsed_columns(batch.to_pandas())
+                        if schema.bronze_dtypes:
+                            chunk = chunk.astype(schema.bronze_dtypes, copy=False)
+                        chunk = self._drop_redundant_columns(chunk)
+                        chunk = self._rename_columns(chunk)
+                        chunk = self._cast_dtypes(chunk)
+
+                    counts = self._count_nulls(chunk)
+                    null_counts = counts if null_counts is None else null_counts + counts
+                    n_rows += len(chunk)
+
+                    if writer is None:
+                        arrow_schema = pa.Schema.from_pandas(chunk, preserve_index=False)
+                        writer = pq.ParquetWriter(tmp_path, arrow_schema, **self._parquet_options(arrow_schema))
+                    writer.write_table(
+                        pa.Table.from_pandas(chunk, schema=arrow_schema, preserve_index=False),
+                        row_group_size=self._row_group_size,
+                    )
+            except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+                self.logger.warning(f"[TRANSFORM] Block does not fit first block ({e}) — loading in memory")
+                return None
+            finally:
+                if writer:
+                    writer.close()
+
+            if writer is None:
+                return 0
+
+            # Equivalent of _drop_empty_columns over the whole file
+            empty = [col for col, count in null_counts.items() if count == n_rows]
+            self.logger.info(
+                f"[TRANSFORM] Dropped {len(empty)} empty column(s) | Remaining: {len(null_counts) - len(empty)}"
+            )
+            if empty:
+                self._drop_parquet_columns(tmp_path, output_path, empty)
+            else:
+                tmp_path.replace(output_path)
+        finally:
+            # No-op once replace() has moved the file into place
+            tmp_path.unlink(missing_ok=True)
+
+        self._report_nulls(null_counts.drop(empty), schema.expected_nulls, list(schema.required))
+        self.logger.info(f"[SAVE] Saved to Silver: {output_path}")
+        self.logger.info(f"[SAVE] Shape: {n_rows} rows x {len(null_counts) - len(empty)} columns")
+        self.logger.info(f"[SAVE] Size: {output_path.stat().st_size / 1024:.1f} KB")
+        return n_rows
+
+    def _drop_parquet_columns(self, source: Path, target: Path, columns: list) -> None:
+        """Copy *source* to *target* without *columns*, one row group at a time."""
+        parquet_file = pq.ParquetFile(source)
+        keep = [name for name in parquet_file.schema_arrow.names if name not in columns]
+
+        arrow_schema = pa.schema([parquet_file.schema_arrow.field(name) for name in keep])
+        pandas_meta = parquet_file.schema_arrow.pandas_metadata
+        if pandas_meta:
+            pandas_meta["columns"] = [c for c in pandas_meta["columns"] if c["name"] not in columns]
+            arrow_schema = arrow_schema.with_metadata({b"pandas": json.dumps(pandas_meta).encode()})
+
+        with pq.ParquetWriter(target, arrow_schema, **self._parquet_options(arrow_schema)) as writer:
+            for i in range(parquet_file.num_row_groups):
+                table = parquet_file.read_row_group(i, columns=keep)
+                writer.write_table(table.replace_schema_metadata(arrow_schema.metadata))
+
     # ------------------------------------------------------------------ #
     #  Orchestration                                                     #
     # ------------------------------------------------------------------ #
 
-    def run(self) -> None:
-        """Orchestrate full Bronze -> Silver pipeline: load -> transform -> save."""
+    def _cache_key(self) -> str:
+        """
+        Hash of everything the Silver output depends on: the Bronze file
+        content, the source of every transformer module in the class
+        hierarchy, the Parquet writer options and _cache_extra().
+        """
+        h = hashlib.blake2b(digest_size=16)
+
+        with open(self.bronze_path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                h.update(block)
+
+        modules = dict.fromkeys(
+            cls.__module__ for cls in type(self).__mro__
+            if issubclass(cls, BaseTransformer)
+        )
+        for module in modules:
+            h.update(inspect.getsource(sys.modules[module]).encode())
+
+        h.update(json.dumps(self._parquet_options(), sort_keys=True).encode())
+        h.update(self._cache_extra().encode())
+        return h.hexdigest()
+
+    def _cache_extra(self) -> str:
+        """Override to add instance configuration to the cache key."""
+        return ""
+
+    def run(self, force: bool = False) -> None:
+        """
+        Orchestrate full Bronze -> Silver pipeline: load -> transform -> save.
+
+        Skipped if the Silver Parquet exists and its sidecar .hash matches
+        the current _cache_key(). Pass force=True to always rebuild.
+        """
         self._check_output_filename()
         t0 = time.perf_counter()
 
         try:
             self.logger.info(f"[RUN] Starting Bronze -> Silver: {self.bronze_path.name}")
 
-            df = self.load_bronze()
-            if df.empty:
-                self.logger.error("[RUN] Aborting — empty DataFrame after load")
+            if not self.bronze_path.exists():
+                raise FileNotFoundError(f"Bronze file not found: {self.bronze_path}")
+
+            output_path = self.silver_path / self._output_filename
+            hash_path = output_path.with_name(output_path.name + ".hash")
+            cache_key = self._cache_key()
+
+            if (
+                not force
+                and output_path.exists()
+                and hash_path.exists()
+                and hash_path.read_text() == cache_key
+            ):
+                self.logger.info(f"[RUN] Up to date: {self._output_filename} [SKIPPED]")
                 return
 
-            df = self.transform(df)
-            self.save_silver(df, self._output_filename)
+            n_rows = (
+                self._stream_to_silver(output_path)
+                if self._stream_block_size and self.bronze_path.suffix == ".csv"
+                else None
+            )
+
+            if n_rows is None:
+                df = self.load_bronze()
+                if df.empty:
+                    self.logger.error("[RUN] Aborting — empty DataFrame after load")
+                    return
+
+                df = self.transform(df)
+                self.save_silver(df, self._output_filename)
+                n_rows = len(df)
+
+            if n_rows == 0:
+                self.logger.error("[RUN] Aborting — no rows in Bronze file")
+                return
+
+            hash_path.write_text(cache_key)
 
             elapsed = time.perf_counter() - t0
             self.logger.info(f"[RUN] Complete: {self._output_filename} [OK] ({elapsed:.2f}s)")
@@ -327,6 +892,8 @@ class SilverTransformer(BaseTransformer):
                 exc_info=True,
             )
             raise
+        finally:
+            self._flush_logs()
 
 
 # ====================================================================== #
@@ -334,6 +901,26 @@ class SilverTransformer(BaseTransformer):
 # ====================================================================== #
 
 
+@dataclass(frozen=True)
+class JoinStep:
+    """
+    One left join in a Gold build: df.merge(tables[right][cols]).
+
+    Args:
+        right:    Key of the right-hand table in the loaded tables dict
+        left_on:  Join key in the accumulated DataFrame
+        right_on: Join key in the right-hand table
+        cols:     Columns taken from the right-hand table (incl. right_on)
+        rename:   Optional renames applied to the right-hand columns
+    """
+
+    right: str
+    left_on: str
+    right_on: str
+    cols: list[str]
+    rename: Optional[dict[str, str]] = None
+
+
 class GoldTransformer(BaseTransformer):
     """
     Base class for Silver -> Gold transformers.
@@ -342,6 +929,9 @@ class GoldTransformer(BaseTransformer):
       1. Loads required Silver Parquets internally
       2. Joins / enriches / aggregates
       3. Returns the final Gold DataFrame
+
+    Join sequences are declared as lists of JoinStep and executed by
+    apply_joins().
     """
 
     def __init__(self, silver_path: Path, gold_path: Path, log_file: str):
@@ -351,6 +941,33 @@ class GoldTransformer(BaseTransformer):
             gold_path=gold_path,
         )
 
+    # ------------------------------------------------------------------ #
+    #  Join engine                                                       #
+    # ------------------------------------------------------------------ #
+
+    def apply_joins(
+        self, df: pd.DataFrame, tables: dict, steps: list[JoinStep]
+    ) -> pd.DataFrame:
+        """
+        Execute *steps* as a chain of left joins onto *df*.
+
+        Steps run in declared order: pandas resolves overlapping column
+        names with _x/_y suffixes, so reordering would change the output.
+        Renames are applied to the (small) right-hand projection before
+        the merge, so the accumulated frame is never copied just to rename.
+        """
+        for step in steps:
+            right = tables[step.right][step.cols]
+            if step.rename:
+                right = right.rename(columns=step.rename, copy=False)
+
+            df = df.merge(right, left_on=step.left_on, right_on=step.right_on, how="left")
+
+            label = ", ".join(step.rename.values()) if step.rename else step.right
+            self.logger.info(f"[JOIN] After {label}: {df.shape}")
+
+        return df
+
     # ------------------------------------------------------------------ #
     #  Abstract                                                          #
     # ------------------------------------------------------------------ #
@@ -389,3 +1006,5 @@ class GoldTransformer(BaseTransformer):
                 exc_info=True,
             )
             raise
+        finally:
+            self._flush_logs()
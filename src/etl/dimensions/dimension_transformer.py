@@ -33,8 +33,11 @@ class DimensionTransformer(SilverTransformer):
             log_file=self.config["log_file"]
         )
 
+    def _cache_extra(self) -> str:
+        return yaml.safe_dump(self.config, sort_keys=True)
+
     def _rename_columns(self, df: pd.DataFrame) -> pd.DataFrame:
-        df = df.rename(columns=self.config["rename"])
+        df = df.rename(columns=self.config["rename"], copy=False)
         self.logger.info("[TRANSFORM] Columns renamed to snake_case")
         return df
 
@@ -45,11 +48,9 @@ class DimensionTransformer(SilverTransformer):
             self.config["rename"].get(col, col)
             for col in self.config["date_columns"]
         ]
-        for col in date_cols_renamed:
-            if col in df.columns:
-                df[col] = self._to_datetime(df[col])
-                self.logger.info(f"[TRANSFORM] Cast to datetime: {col}")
-        return df
+        return self._cast_datetime_columns(
+            df, [col for col in date_cols_renamed if col in df.columns]
+        )
 
     def _handle_nulls(self, df: pd.DataFrame) -> pd.DataFrame:
         expected = {"valid_to": "Currently active records"} if "valid_to" in df.columns else {}
@@ -7,6 +7,9 @@ class PeopleTransformer(SilverTransformer):
 
     _output_filename = "people.parquet"
 
+    _PARSED_COLUMNS = {"ValidFrom": "ValidFrom_parsed"}
+    _DROP_COLUMNS = frozenset({"HashedPassword", "UserPreferences", "Photo", "OtherLanguages"})
+
     def __init__(self):
         super().__init__(
             bronze_path=BASE_DIR / "data" / "bronze" / "actual" / "application.people.csv",
@@ -31,25 +34,18 @@ class PeopleTransformer(SilverTransformer):
             "EmailAddress":           "email_address",
             "LastEditedBy":           "last_edited_by",
             "ValidFrom":              "valid_from",
-            "ValidTo":                "valid_to",
-            "ValidFrom_parsed":       "valid_from_parsed"
+            "ValidTo":                "valid_to"
         }
-        df = df.rename(columns=column_mapping)
+        df = df.rename(columns=column_mapping, copy=False)
         self.logger.info("[TRANSFORM] Columns renamed to snake_case")
         return df
 
     
     def _cast_dtypes(self, df: pd.DataFrame) -> pd.DataFrame:
-        for col in ["valid_from", "valid_to"]:
-            df[col] = self._to_datetime(df[col])
-            self.logger.info(f"[TRANSFORM] Cast to datetime: {col}")
-
-        df = df.drop(columns=["valid_from_parsed"], errors="ignore")
-        return df
+        return self._cast_datetime_columns(df, ["valid_from", "valid_to"])
 
     def _handle_nulls(self, df: pd.DataFrame) -> pd.DataFrame:
-        # HashedPassword, UserPreferences, Photo, CustomFields, OtherLanguages:
-        # already removed by _drop_empty_columns (all 906 nulls)
+        # CustomFields: removed by _drop_empty_columns when empty
         return self._validate_nulls(
             df,
             expected_nulls={
@@ -27,15 +27,12 @@ class ProvinceTransformer(SilverTransformer):
             "ValidFrom":                 "valid_from",
             "ValidTo":                   "valid_to"
         }
-        df = df.rename(columns=column_mapping)
+        df = df.rename(columns=column_mapping, copy=False)
         self.logger.info("[TRANSFORM] Columns renamed to snake_case")
         return df
 
     def _cast_dtypes(self, df: pd.DataFrame) -> pd.DataFrame:
-        for col in ["valid_from", "valid_to"]:
-            df[col] = self._to_datetime(df[col])
-            self.logger.info(f"[TRANSFORM] Cast to datetime: {col}")
-        return df
+        return self._cast_datetime_columns(df, ["valid_from", "valid_to"])
 
     def _handle_nulls(self, df: pd.DataFrame) -> pd.DataFrame:
         return self._validate_nulls(
@@ -26,14 +26,12 @@ class StockItemHoldingsTransformer(SilverTransformer):
             "LastEditedBy":          "last_edited_by",
             "LastEditedWhen":        "last_edited_when"
         }
-        df = df.rename(columns=column_mapping)
+        df = df.rename(columns=column_mapping, copy=False)
         self.logger.info("[TRANSFORM] Columns renamed to snake_case")
         return df
 
     def _cast_dtypes(self, df: pd.DataFrame) -> pd.DataFrame:
-        df["last_edited_when"] = self._to_datetime(df["last_edited_when"])
-        self.logger.info("[TRANSFORM] Cast to datetime: last_edited_when")
-        return df
+        return self._cast_datetime_columns(df, ["last_edited_when"])
 
     def _handle_nulls(self, df: pd.DataFrame) -> pd.DataFrame:
         return self._validate_nulls(
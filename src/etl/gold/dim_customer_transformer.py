@@ -1,6 +1,6 @@
 import pandas as pd
 from pathlib import Path
-from src.etl.base_transformer import GoldTransformer, BASE_DIR
+from src.etl.base_transformer import GoldTransformer, JoinStep, BASE_DIR
 
 
 class DimCustomerTransformer(GoldTransformer):
@@ -18,6 +18,25 @@ class DimCustomerTransformer(GoldTransformer):
 
     _output_filename = "dim_customer.parquet"
 
+    _RESPONSIBLE_MARKET_JOIN_STEPS = [
+        JoinStep("countries", "country_id", "country_id",
+                 ["country_id", "country_name", "iso_alpha3_code", "continent", "region", "subregion"]),
+        JoinStep("cities", "state_province_id", "state_province_id",
+                 ["state_province_id", "city_id", "city_name"]),
+    ]
+
+    _JOIN_STEPS = [
+        JoinStep("delivery_methods", "delivery_method_id", "delivery_method_id",
+                 ["delivery_method_id", "delivery_method_name"]),
+        JoinStep("responsible_market", "delivery_city_id", "city_id",
+                 ["city_id", "city_name", "country_name", "state_province_code",
+                  "state_province_name", "iso_alpha3_code", "continent", "region",
+                  "subregion", "sales_territory"]),
+        # people (for contact info)
+        JoinStep("people", "primary_contact_person_id", "person_id",
+                 ["person_id", "full_name", "email_address"]),
+    ]
+
     def __init__(self):
         super().__init__(
             silver_path=BASE_DIR / "data" / "silver",
@@ -51,62 +70,16 @@ class DimCustomerTransformer(GoldTransformer):
     def _build_responsible_market(self, tables: dict) -> pd.DataFrame:
         """Build responsible_market table from provinces, countries, and cities."""
         self.logger.info("[JOIN] Building responsible_market dimension...")
-        
-        # Join provinces with countries
-        responsible_market = tables['provinces'].merge(
-            tables['countries'][["country_id", "country_name", "iso_alpha3_code", "continent", "region", "subregion"]],
-            on="country_id",
-            how="left"
-        )
-        self.logger.info(f"[JOIN] After provinces+countries: {responsible_market.shape}")
-        
-        # Join with cities
-        responsible_market = responsible_market.merge(
-            tables['cities'][["state_province_id", "city_id", "city_name"]],
-            on="state_province_id",
-            how="left"
-        )
-        self.logger.info(f"[JOIN] After cities join: {responsible_market.shape}")
-        
-        return responsible_market
+
+        return self.apply_joins(tables['provinces'], tables, self._RESPONSIBLE_MARKET_JOIN_STEPS)
 
     def _build_customer_dimension(self, tables: dict, responsible_market: pd.DataFrame) -> pd.DataFrame:
         """Build customer dimension by joining all related tables."""
         self.logger.info("[JOIN] Building customer dimension...")
-        
-        # Start with customers
-        df = tables['customers'].copy()
-        self.logger.info(f"[JOIN] Starting with customers: {df.shape}")
-        
-        # Join delivery methods
-        df = df.merge(
-            tables['delivery_methods'][["delivery_method_id", "delivery_method_name"]],
-            on="delivery_method_id",
-            how="left"
-        )
-        self.logger.info(f"[JOIN] After delivery_methods: {df.shape}")
-        
-        # Join responsible_market
-        df = df.merge(
-            responsible_market[["city_id", "city_name", "country_name", "state_province_code", 
-                               "state_province_name", "iso_alpha3_code", "continent", "region", 
-                               "subregion", "sales_territory"]],
-            left_on="delivery_city_id",
-            right_on="city_id",
-            how="left"
-        )
-        self.logger.info(f"[JOIN] After responsible_market: {df.shape}")
-        
-        # Join people (for contact info)
-        df = df.merge(
-            tables['people'][["person_id", "full_name", "email_address"]],
-            left_on="primary_contact_person_id",
-            right_on="person_id",
-            how="left"
-        )
-        self.logger.info(f"[JOIN] After people: {df.shape}")
-        
-        return df
+        self.logger.info(f"[JOIN] Starting with customers: {tables['customers'].shape}")
+
+        tables = {**tables, 'responsible_market': responsible_market}
+        return self.apply_joins(tables['customers'], tables, self._JOIN_STEPS)
 
     def _select_columns(self, df: pd.DataFrame) -> pd.DataFrame:
         """Select and order columns for the dimension."""
@@ -142,7 +115,8 @@ class DimCustomerTransformer(GoldTransformer):
         
         # Get parent customer credits
         main_customer_credits = df[['customer_id', 'credit_limit']].rename(
-            columns={'customer_id': 'bill_to_customer_id', 'credit_limit': 'parent_credit_limit'}
+            columns={'customer_id': 'bill_to_customer_id', 'credit_limit': 'parent_credit_limit'},
+            copy=False,
         )
         df = df.merge(main_customer_credits, on='bill_to_customer_id', how='left')
         
@@ -155,7 +129,7 @@ class DimCustomerTransformer(GoldTransformer):
         )
 
         # Remove temporary column immediately
-        df = df.drop(columns=['parent_credit_limit'])
+        del df['parent_credit_limit']
         
         after_null = df['credit_limit'].isna().sum()
         self.logger.info(f"[IMPUTE] credit_limit after imputation: {after_null} missing")
@@ -237,7 +211,7 @@ class DimCustomerTransformer(GoldTransformer):
             'sales_territory': 'sales_territory'
         }
         
-        df = df.rename(columns=column_mapping)
+        df = df.rename(columns=column_mapping, copy=False)
         self.logger.info(f"[RENAME] Renamed {len(column_mapping)} columns")
         
         return df
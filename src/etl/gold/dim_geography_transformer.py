@@ -1,6 +1,6 @@
 import pandas as pd
 from pathlib import Path
-from src.etl.base_transformer import GoldTransformer, BASE_DIR
+from src.etl.base_transformer import GoldTransformer, JoinStep, BASE_DIR
 
 
 class DimGeographyTransformer(GoldTransformer):
@@ -18,6 +18,13 @@ class DimGeographyTransformer(GoldTransformer):
 
     _output_filename = "dim_geography.parquet"
 
+    _RESPONSIBLE_MARKET_JOIN_STEPS = [
+        JoinStep("countries", "country_id", "country_id",
+                 ["country_id", "country_name", "iso_alpha3_code", "continent", "region", "subregion"]),
+        JoinStep("cities", "state_province_id", "state_province_id",
+                 ["state_province_id", "city_id", "city_name"]),
+    ]
+
     def __init__(self):
         super().__init__(
             silver_path=BASE_DIR / "data" / "silver",
@@ -48,25 +55,8 @@ class DimGeographyTransformer(GoldTransformer):
     def _build_responsible_market(self, tables: dict) -> pd.DataFrame:
         """Build responsible_market table from provinces, countries, and cities."""
         self.logger.info("[JOIN] Building responsible_market dimension...")
-        
-        # Join provinces with countries
-        responsible_market = tables['provinces'].merge(
-            tables['countries'][["country_id", "country_name", "iso_alpha3_code", "continent", "region", "subregion"]],
-            on="country_id",
-            how="left"
-        )
-        self.logger.info(f"[JOIN] After provinces+countries: {responsible_market.shape}")
-        
-        # Join with cities
-        responsible_market = responsible_market.merge(
-            tables['cities'][["state_province_id", "city_id", "city_name"]],
-            on="state_province_id",
-            how="left"
-        )
-        self.logger.info(f"[JOIN] After cities join: {responsible_market.shape}")
-        
-        return responsible_market
 
+        return self.apply_joins(tables['provinces'], tables, self._RESPONSIBLE_MARKET_JOIN_STEPS)
 
 
     def _select_columns(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -112,7 +102,7 @@ class DimGeographyTransformer(GoldTransformer):
             'latest_recorded_population': 'latest_recorded_population'
         }
         
-        df = df.rename(columns=column_mapping)
+        df = df.rename(columns=column_mapping, copy=False)
         self.logger.info(f"[RENAME] Renamed {len(column_mapping)} columns")
         
         return df
@@ -1,6 +1,6 @@
 import pandas as pd
 from pathlib import Path
-from src.etl.base_transformer import GoldTransformer, BASE_DIR
+from src.etl.base_transformer import GoldTransformer, JoinStep, BASE_DIR
 
 
 class DimStockItemTransformer(GoldTransformer):
@@ -18,6 +18,17 @@ class DimStockItemTransformer(GoldTransformer):
 
     _output_filename = "dim_stock_item.parquet"
 
+    _JOIN_STEPS = [
+        JoinStep("colors", "color_id", "color_id", ["color_id", "color_name"],
+                 rename={"color_name": "color"}),
+        JoinStep("package_types", "unit_package_id", "package_type_id",
+                 ["package_type_id", "package_type_name"],
+                 rename={"package_type_name": "unit_package"}),
+        JoinStep("package_types", "outer_package_id", "package_type_id",
+                 ["package_type_id", "package_type_name"],
+                 rename={"package_type_name": "outer_package"}),
+    ]
+
     def __init__(self):
         super().__init__(
             silver_path=BASE_DIR / "data" / "silver",
@@ -48,37 +59,8 @@ class DimStockItemTransformer(GoldTransformer):
     def _build_stock_item_dimension(self, tables: dict) -> pd.DataFrame:
         """Build stock item dimension."""
         self.logger.info("[JOIN] Building stock item dimension...")
-        
-        # Join provinces with countries
-        stock_items = tables['stock_items'].merge(
-            tables['colors'][["color_id", "color_name"]],
-            on="color_id",
-            how="left"
-        ).rename(columns={"color_name": "color"})
-
-        self.logger.info(f"[JOIN] After colors join: {stock_items.shape}")
-        
-        # Join with package types unit
-        stock_items = stock_items.merge(
-            tables['package_types'][["package_type_id", "package_type_name"]],
-            right_on="package_type_id",
-            left_on="unit_package_id",
-            how="left"
-        ).rename(columns={"package_type_name": "unit_package"})
-
-        self.logger.info(f"[JOIN] After package types unit join: {stock_items.shape}")
-
-        # Join with package types outer
-        stock_items = stock_items.merge(
-            tables['package_types'][["package_type_id", "package_type_name"]],
-            right_on="package_type_id",
-            left_on="outer_package_id",
-            how="left"
-        ).rename(columns={"package_type_name": "outer_package"})
-        
-        self.logger.info(f"[JOIN] After package types outer join: {stock_items.shape}")
-        
-        return stock_items
+
+        return self.apply_joins(tables['stock_items'], tables, self._JOIN_STEPS)
 
 
     def _select_columns(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -137,7 +119,7 @@ class DimStockItemTransformer(GoldTransformer):
             "search_details":             "search_details"
                 }
         
-        df = df.rename(columns=column_mapping)
+        df = df.rename(columns=column_mapping, copy=False)
         self.logger.info(f"[RENAME] Renamed {len(column_mapping)} columns")
         
         return df
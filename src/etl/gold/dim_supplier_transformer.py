@@ -1,6 +1,6 @@
 import pandas as pd
 from pathlib import Path
-from src.etl.base_transformer import GoldTransformer, BASE_DIR
+from src.etl.base_transformer import GoldTransformer, JoinStep, BASE_DIR
 
 
 class DimSupplierTransformer(GoldTransformer):
@@ -18,6 +18,18 @@ class DimSupplierTransformer(GoldTransformer):
 
     _output_filename = "dim_supplier.parquet"
 
+    _JOIN_STEPS = [
+        JoinStep("delivery_methods", "delivery_method_id", "delivery_method_id",
+                 ["delivery_method_id", "delivery_method_name"]),
+        # people.phone_number collides with suppliers.phone_number -> phone_number_y
+        JoinStep("people", "primary_contact_person_id", "person_id",
+                 ["person_id", "full_name", "email_address", "phone_number"]),
+        JoinStep("cities", "delivery_city_id", "city_id", ["city_id", "city_name"],
+                 rename={"city_name": "delivery_city"}),
+        JoinStep("cities", "postal_city_id", "city_id", ["city_id", "city_name"],
+                 rename={"city_name": "postal_city"}),
+    ]
+
     def __init__(self):
         super().__init__(
             silver_path=BASE_DIR / "data" / "silver",
@@ -49,48 +61,8 @@ class DimSupplierTransformer(GoldTransformer):
     def _build_supplier_dimension(self, tables: dict) -> pd.DataFrame:
         """Build supplier table from suppliers, cities, delivery_methods, and people."""
         self.logger.info("[JOIN] Building supplier dimension...")
-        
-        # Join with delivery methods
-        suppliers = tables['suppliers'].merge(
-            tables['delivery_methods'][["delivery_method_id", "delivery_method_name"]],
-            on="delivery_method_id",
-            how="left"
-        )
-
-        self.logger.info(f"[JOIN] After suppliers+delivery_methods: {suppliers.shape}")
-        
-        # Join with people
-        suppliers = suppliers.merge(
-            tables['people'][["person_id","full_name","email_address","phone_number"]],
-            left_on="primary_contact_person_id",
-            right_on="person_id",
-            how="left"
-        )
 
-        self.logger.info(f"[JOIN] After people join: {suppliers.shape}")
-
-        # Join with cities delivery
-        suppliers = suppliers.merge(
-            tables['cities'][["city_id", "city_name"]],
-            left_on="delivery_city_id",
-            right_on="city_id",
-            how="left"
-        ).rename(columns={"city_name": "delivery_city"})
-
-        self.logger.info(f"[JOIN] After cities delivery join: {suppliers.shape}")
-
-        # Join with cities postal
-        suppliers = suppliers.merge(
-            tables['cities'][["city_id", "city_name"]],
-            left_on="postal_city_id",
-            right_on="city_id",
-            how="left"
-        ).rename(columns={"city_name": "postal_city"})
-
-        self.logger.info(f"[JOIN] After cities postal join: {suppliers.shape}")
-
-        
-        return suppliers
+        return self.apply_joins(tables['suppliers'], tables, self._JOIN_STEPS)
 
 
     def _select_columns(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -191,7 +163,7 @@ class DimSupplierTransformer(GoldTransformer):
             "bank_account_code": "bank_account_code"
         }
         
-        df = df.rename(columns=column_mapping)
+        df = df.rename(columns=column_mapping, copy=False)
         self.logger.info(f"[RENAME] Renamed {len(column_mapping)} columns")
         
         return df
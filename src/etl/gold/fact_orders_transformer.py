@@ -1,6 +1,6 @@
 import pandas as pd
 from pathlib import Path
-from src.etl.base_transformer import GoldTransformer, BASE_DIR
+from src.etl.base_transformer import GoldTransformer, JoinStep, BASE_DIR
 
 
 class FactOrdersTransformer(GoldTransformer):
@@ -18,6 +18,19 @@ class FactOrdersTransformer(GoldTransformer):
 
     _output_filename = "fact_orders.parquet"
 
+    _JOIN_STEPS = [
+        JoinStep("customers", "customer_id", "customer_id", ["customer_id", "customer_name"]),
+        # Sales person / contact person
+        JoinStep("people", "salesperson_id", "person_id", ["person_id", "full_name"],
+                 rename={"full_name": "sales_person"}),
+        JoinStep("people", "contact_person_id", "person_id", ["person_id", "full_name"],
+                 rename={"full_name": "contact_person"}),
+        # order_lines (1:n -> explodes to line grain)
+        JoinStep("order_lines", "order_id", "order_id",
+                 ["order_id", "order_line_id", "stock_item_id", "description", "package_type_id",
+                  "quantity", "unit_price", "tax_rate", "picked_quantity", "picking_completed_when"]),
+    ]
+
     def __init__(self):
         super().__init__(
             silver_path=BASE_DIR / "data" / "silver",
@@ -49,51 +62,9 @@ class FactOrdersTransformer(GoldTransformer):
     def _build_orders_fact(self, tables: dict) -> pd.DataFrame:
         """Build orders fact by joining all related tables."""
         self.logger.info("[JOIN] Building orders fact...")
-        
-        # Start with customers
-        df = tables['orders'].copy()
-        self.logger.info(f"[JOIN] Starting with orders: {df.shape}")
-        
-        # Join customers
-        df = df.merge(
-            tables['customers'][["customer_id","customer_name"]],
-            on="customer_id",
-            how="left"
-        )
-        self.logger.info(f"[JOIN] After customers: {df.shape}")
-        
-        # Join people - sales person
-        df = df.merge(
-            tables['people'][["person_id", "full_name"]],
-            left_on="salesperson_id",
-            right_on="person_id",
-            how="left"
-        ).rename(columns={"full_name": "sales_person"})
-
-        self.logger.info(f"[JOIN] After sales_person: {df.shape}")
-        
-        # Join people - contact person
-        df = df.merge(
-            tables['people'][["person_id","full_name"]],
-            left_on = "contact_person_id",
-            right_on = "person_id",
-            how="left"
-        ).rename(columns={"full_name": "contact_person"})
-
-        self.logger.info(f"[JOIN] After contact_person: {df.shape}")
-        
-        # Join order_lines 
-        df = df.merge(
-            tables['order_lines'][["order_id","order_line_id","stock_item_id","description","package_type_id","quantity","unit_price","tax_rate","picked_quantity","picking_completed_when"]],
-            on=["order_id"],
-            how="left"
-        )
+        self.logger.info(f"[JOIN] Starting with orders: {tables['orders'].shape}")
 
-        self.logger.info(f"[JOIN] After order_lines: {df.shape}")
-        
-        return df
-    
-        
+        return self.apply_joins(tables['orders'], tables, self._JOIN_STEPS)
 
     def _select_columns(self, df: pd.DataFrame) -> pd.DataFrame:
         """Select and order columns for the fact_orders table."""
@@ -138,7 +109,7 @@ class FactOrdersTransformer(GoldTransformer):
             "customer_po_number":"customer_phone_number",
         }
         
-        df = df.rename(columns=column_mapping)
+        df = df.rename(columns=column_mapping, copy=False)
         self.logger.info(f"[RENAME] Renamed {len(column_mapping)} columns")
         
         return df
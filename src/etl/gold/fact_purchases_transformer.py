@@ -1,6 +1,6 @@
 import pandas as pd
 from pathlib import Path
-from src.etl.base_transformer import GoldTransformer, BASE_DIR
+from src.etl.base_transformer import GoldTransformer, JoinStep, BASE_DIR
 
 
 class FactPurchasesTransformer(GoldTransformer):
@@ -18,6 +18,16 @@ class FactPurchasesTransformer(GoldTransformer):
 
     _output_filename = "fact_purchases.parquet"
 
+    _JOIN_STEPS = [
+        JoinStep("people", "contact_person_id", "person_id", ["person_id", "full_name"],
+                 rename={"full_name": "contact_person"}),
+        # purchase_order_lines (1:n -> explodes to line grain)
+        JoinStep("purchase_order_lines", "purchase_order_id", "purchase_order_id",
+                 ["purchase_order_id", "purchase_order_line_id", "stock_item_id", "ordered_outers",
+                  "received_outers", "package_type_id", "description",
+                  "expected_unit_price_per_outer", "last_receipt_date"]),
+    ]
+
     def __init__(self):
         super().__init__(
             silver_path=BASE_DIR / "data" / "silver",
@@ -48,35 +58,9 @@ class FactPurchasesTransformer(GoldTransformer):
     def _build_purchases_fact(self, tables: dict) -> pd.DataFrame:
         """Build purchases fact by joining all related tables."""
         self.logger.info("[JOIN] Building purchases fact...")
-        
-        # Start with customers
-        df = tables['purchases'].copy()
-        self.logger.info(f"[JOIN] Starting with purchases: {df.shape}")
-        
-        # Join customers
-        df = df.merge(
-            tables['people'][["person_id","full_name"]],
-            left_on="contact_person_id",
-            right_on="person_id",
-            how="left"
-        ).rename(columns={"full_name": "contact_person"})
-        self.logger.info(f"[JOIN] After persons: {df.shape}")
-        
-        # Join purchase_lines 
-        df = df.merge(
-            tables['purchase_order_lines'][["purchase_order_id","purchase_order_line_id","stock_item_id","ordered_outers","received_outers","package_type_id","description","package_type_id","expected_unit_price_per_outer","last_receipt_date"]],
-            on = ["purchase_order_id"],
-            how = "left"
-        )
+        self.logger.info(f"[JOIN] Starting with purchases: {tables['purchases'].shape}")
 
-        self.logger.info(f"[JOIN] After purchase_order_lines: {df.shape}")
-
-        duplicate_cols = df.columns[df.columns.duplicated()].tolist()
-        if duplicate_cols:
-            self.logger.warning(f"[JOIN] Removed duplicate columns: {duplicate_cols}")
-            df = df.loc[:, ~df.columns.duplicated(keep="first")]
-
-        return df
+        return self.apply_joins(tables['purchases'], tables, self._JOIN_STEPS)
     
     def _select_columns(self, df: pd.DataFrame) -> pd.DataFrame:
         """Select and order columns for the fact_purchases table."""
@@ -140,7 +124,7 @@ class FactPurchasesTransformer(GoldTransformer):
             "is_order_finalized": "is_finalized"
         }
         
-        df = df.rename(columns=column_mapping)
+        df = df.rename(columns=column_mapping, copy=False)
         self.logger.info(f"[RENAME] Renamed {len(column_mapping)} columns")
         
         return df
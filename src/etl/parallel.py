@@ -0,0 +1,86 @@
+"""
+Process-pool runner for independent transformers.
+
+Transformers that read and write disjoint files share no state, so each
+one can run in its own interpreter (sidesteps the GIL on CSV parsing /
+to_datetime). Workers receive a picklable *factory* (a transformer class
+or functools.partial) instead of an instance, so loggers and file
+handlers are created inside the worker process.
+
+Workers are started with "spawn" (no forked copies of pandas/Arrow thread
+pools) and each one caps Arrow's thread pools to its share of the cores,
+so N workers x Arrow threads do not oversubscribe the host.
+"""
+
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable
+
+import pyarrow as pa
+
+
+def _factory_name(factory: Callable) -> str:
+    """Class name behind a transformer class or functools.partial."""
+    func = getattr(factory, "func", factory)
+    name = getattr(func, "__name__", repr(func))
+    args = getattr(factory, "args", ())
+    return f"{name}({', '.join(map(str, args))})" if args else name
+
+
+def _init_worker(threads: int) -> None:
+    """Worker initializer: limit Arrow's CPU and I/O thread pools."""
+    pa.set_cpu_count(threads)
+    pa.set_io_thread_count(threads)
+
+
+def _run_factory(factory: Callable) -> None:
+    """Worker entry point: build the transformer and run it."""
+    factory().run()
+
+
+def run_parallel(
+    factories: list[Callable],
+    label: str,
+    logger: logging.Logger,
+    max_workers: int = None,
+) -> list[str]:
+    """Run transformers in a process pool, collect errors, continue on failure.
+
+    Args:
+        factories:   Picklable zero-argument callables returning a transformer
+        label:       Log tag (e.g. "Silver")
+        logger:      Logger for the per-transformer OK / FAILED lines
+        max_workers: Worker processes (default: min(len(factories), cpu_count))
+
+    Returns:
+        List of transformer names that failed.
+    """
+    if not factories:
+        return []
+
+    cpu_count = os.cpu_count() or 1
+    max_workers = max_workers or min(len(factories), cpu_count)
+    failed: list[str] = []
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(max(1, cpu_count // max_workers),),
+    ) as executor:
+        futures = {
+            executor.submit(_run_factory, factory): _factory_name(factory)
+            for factory in factories
+        }
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                future.result()
+                logger.info(f"[{label.upper()}] {name} -> OK")
+            except Exception as e:
+                failed.append(name)
+                logger.error(f"[{label.upper()}] {name} -> FAILED: {e}")
+
+    return failed
@@ -1,4 +1,3 @@
-import pandas as pd
 from src.etl.base_transformer import SilverTransformer, BASE_DIR
 
 
@@ -7,6 +6,31 @@ class PurchaseOrderTransformer(SilverTransformer):
 
     _output_filename = "purchase_orders.parquet"
 
+    _COLUMN_MAPPING = {
+        "PurchaseOrderID":       "purchase_order_id",
+        "SupplierID":            "supplier_id",
+        "OrderDate":             "order_date",
+        "DeliveryMethodID":      "delivery_method_id",
+        "ContactPersonID":       "contact_person_id",
+        "ExpectedDeliveryDate":  "expected_delivery_date",
+        "SupplierReference":     "supplier_reference",
+        "IsOrderFinalized":      "is_order_finalized",
+        "LastEditedBy":          "last_edited_by",
+        "LastEditedWhen":        "last_edited_when"
+    }
+
+    _PARSED_COLUMNS = {"LastEditedWhen": "LastEditedWhen_parsed"}
+    _DROP_COLUMNS = frozenset({"Comments", "InternalComments"})
+
+    _DATETIME_COLUMNS = ("order_date", "expected_delivery_date", "last_edited_when")
+
+    _REQUIRED_COLUMNS = (
+        "purchase_order_id",
+        "supplier_id",
+        "order_date",
+        "delivery_method_id",
+    )
+
     def __init__(self):
         super().__init__(
             bronze_path=BASE_DIR / "data" / "bronze" / "actual" / "purchase.order.csv",
@@ -14,41 +38,6 @@ class PurchaseOrderTransformer(SilverTransformer):
             log_file="transform_purchase_orders.log"
         )
 
-    def _rename_columns(self, df: pd.DataFrame) -> pd.DataFrame:
-        column_mapping = {
-            "PurchaseOrderID":       "purchase_order_id",
-            "SupplierID":            "supplier_id",
-            "OrderDate":             "order_date",
-            "DeliveryMethodID":      "delivery_method_id",
-            "ContactPersonID":       "contact_person_id",
-            "ExpectedDeliveryDate":  "expected_delivery_date",
-            "SupplierReference":     "supplier_reference",
-            "IsOrderFinalized":      "is_order_finalized",
-            "LastEditedBy":          "last_edited_by",
-            "LastEditedWhen":        "last_edited_when",
-            "LastEditedWhen_parsed": "last_edited_when_parsed"
-        }
-        df = df.rename(columns=column_mapping)
-        self.logger.info("[TRANSFORM] Columns renamed to snake_case")
-        return df
-
-    def _cast_dtypes(self, df: pd.DataFrame) -> pd.DataFrame:
-        for col in ["order_date", "expected_delivery_date", "last_edited_when"]:
-            df[col] = self._to_datetime(df[col])
-            self.logger.info(f"[TRANSFORM] Cast to datetime: {col}")
-
-        df = df.drop(columns=["last_edited_when_parsed"])
-        self.logger.info("[TRANSFORM] Dropped redundant column: last_edited_when_parsed")
-
-        return df
-
-    def _handle_nulls(self, df: pd.DataFrame) -> pd.DataFrame:
-        # Comments + InternalComments bereits durch _drop_empty_columns entfernt
-        return self._validate_nulls(
-            df,
-            required_columns=["purchase_order_id", "supplier_id", "order_date", "delivery_method_id"],
-        )
-
 
 if __name__ == "__main__":
     transformer = PurchaseOrderTransformer()
@@ -0,0 +1,44 @@
+"""
+Run all purchasing Bronze -> Silver transformers in parallel.
+
+Usage:
+    python -m src.etl.purchasing.run_all
+"""
+
+import time
+
+from src.etl.base_transformer import get_logger
+from src.etl.parallel import run_parallel
+from src.etl.purchasing.purchase_order_transformer import PurchaseOrderTransformer
+from src.etl.purchasing.purchase_order_line_transformer import PurchaseOrderLineTransformer
+from src.etl.purchasing.supplier_transformer import SupplierTransformer
+from src.etl.purchasing.supplier_transaction_transformer import SupplierTransactionTransformer
+
+
+PURCHASING_TRANSFORMERS = [
+    PurchaseOrderTransformer,
+    PurchaseOrderLineTransformer,
+    SupplierTransformer,
+    SupplierTransactionTransformer,
+]
+
+
+def run_purchasing() -> list[str]:
+    """Run every purchasing transformer in its own process.
+
+    Returns:
+        List of class names that failed.
+    """
+    logger = get_logger("run_purchasing.log")
+    t0 = time.perf_counter()
+
+    failed = run_parallel(PURCHASING_TRANSFORMERS, "Purchasing", logger)
+
+    elapsed = time.perf_counter() - t0
+    total = len(PURCHASING_TRANSFORMERS)
+    logger.info(f"Purchasing: {total - len(failed)}/{total} OK ({elapsed:.2f}s)")
+    return failed
+
+
+if __name__ == "__main__":
+    run_purchasing()
@@ -1,4 +1,3 @@
-import pandas as pd
 from src.etl.base_transformer import SilverTransformer, BASE_DIR
 
 
@@ -7,6 +6,40 @@ class OrderLineTransformer(SilverTransformer):
 
     _output_filename = "order_lines.parquet"
 
+    _COLUMN_MAPPING = {
+        "OrderLineID":           "order_line_id",
+        "OrderID":               "order_id",
+        "StockItemID":           "stock_item_id",
+        "Description":           "description",
+        "PackageTypeID":         "package_type_id",
+        "Quantity":              "quantity",
+        "UnitPrice":             "unit_price",
+        "TaxRate":               "tax_rate",
+        "PickedQuantity":        "picked_quantity",
+        "PickingCompletedWhen":  "picking_completed_when",
+        "LastEditedBy":          "last_edited_by",
+        "LastEditedWhen":        "last_edited_when"
+    }
+
+    _PARSED_COLUMNS = {"LastEditedWhen": "LastEditedWhen_parsed"}
+
+    _DATETIME_COLUMNS = ("picking_completed_when", "last_edited_when")
+
+    _EXPECTED_NULLS = {
+        "picking_completed_when": "Order line not yet picked",
+    }
+    _REQUIRED_COLUMNS = ("order_line_id", "order_id", "stock_item_id", "quantity", "unit_price")
+
+    _stream_block_size = 32 << 20
+
+    # Ids increase with the row order: delta-encode them instead of
+    # building per-row-group dictionaries that hold every value once
+    _column_encoding = {
+        "order_line_id": "DELTA_BINARY_PACKED",
+        "order_id":      "DELTA_BINARY_PACKED",
+    }
+    _row_group_size = 500_000
+
     def __init__(self):
         super().__init__(
             bronze_path=BASE_DIR / "data" / "bronze" / "actual" / "sales.orderline.csv",
@@ -15,57 +48,6 @@ class OrderLineTransformer(SilverTransformer):
         )
 
 
-    # ------------------------------------------------------------------ #
-    #  Private transformation steps                                       #
-    # ------------------------------------------------------------------ #
-
-    def _rename_columns(self, df: pd.DataFrame) -> pd.DataFrame:
-        column_mapping = {
-            "OrderLineID":           "order_line_id",
-            "OrderID":               "order_id",
-            "StockItemID":           "stock_item_id",
-            "Description":           "description",
-            "PackageTypeID":         "package_type_id",
-            "Quantity":              "quantity",
-            "UnitPrice":             "unit_price",
-            "TaxRate":               "tax_rate",
-            "PickedQuantity":        "picked_quantity",
-            "PickingCompletedWhen":  "picking_completed_when",
-            "LastEditedBy":          "last_edited_by",
-            "LastEditedWhen":        "last_edited_when",
-            "LastEditedWhen_parsed": "last_edited_when_parsed"
-        }
-        df = df.rename(columns=column_mapping)
-        self.logger.info("[TRANSFORM] Columns renamed to snake_case")
-        return df
-
-
-    def _cast_dtypes(self, df: pd.DataFrame) -> pd.DataFrame:
-        # Cast date strings to datetime
-        date_columns = [
-            "picking_completed_when",
-            "last_edited_when"
-        ]
-        for col in date_columns:
-            df[col] = self._to_datetime(df[col])
-            self.logger.info(f"[TRANSFORM] Cast to datetime: {col}")
-
-        # Drop redundant parsed column
-        df = df.drop(columns=["last_edited_when_parsed"])
-        self.logger.info("[TRANSFORM] Dropped redundant column: last_edited_when_parsed")
-
-        return df
-
-
-    def _handle_nulls(self, df: pd.DataFrame) -> pd.DataFrame:
-        return self._validate_nulls(
-            df,
-            expected_nulls={
-                "picking_completed_when": "Order line not yet picked",
-            },
-            required_columns=["order_line_id", "order_id", "stock_item_id", "quantity", "unit_price"],
-        )
-
 if __name__ == "__main__":
     transformer = OrderLineTransformer()
     transformer.run()
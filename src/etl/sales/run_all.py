@@ -0,0 +1,46 @@
+"""
+Run all sales Bronze -> Silver transformers in parallel.
+
+Usage:
+    python -m src.etl.sales.run_all
+"""
+
+import time
+
+from src.etl.base_transformer import get_logger
+from src.etl.parallel import run_parallel
+from src.etl.sales.customer_transformer import CustomerTransformer
+from src.etl.sales.invoice_transformer import InvoiceTransformer
+from src.etl.sales.invoice_line_transformer import InvoiceLineTransformer
+from src.etl.sales.order_transformer import OrderTransformer
+from src.etl.sales.orderline_transformer import OrderLineTransformer
+
+
+SALES_TRANSFORMERS = [
+    OrderTransformer,
+    OrderLineTransformer,
+    CustomerTransformer,
+    InvoiceTransformer,
+    InvoiceLineTransformer,
+]
+
+
+def run_sales() -> list[str]:
+    """Run every sales transformer in its own process.
+
+    Returns:
+        List of class names that failed.
+    """
+    logger = get_logger("run_sales.log")
+    t0 = time.perf_counter()
+
+    failed = run_parallel(SALES_TRANSFORMERS, "Sales", logger)
+
+    elapsed = time.perf_counter() - t0
+    total = len(SALES_TRANSFORMERS)
+    logger.info(f"Sales: {total - len(failed)}/{total} OK ({elapsed:.2f}s)")
+    return failed
+
+
+if __name__ == "__main__":
+    run_sales()
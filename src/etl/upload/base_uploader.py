@@ -5,11 +5,31 @@ Supports both Bronze (CSV) and Silver/Gold (Parquet) uploads
 by parameterizing the file extension.
 """
 
+import atexit
+import hashlib
 import logging
+import logging.handlers
+import mmap
 import os
-from azure.storage.blob import BlobServiceClient
+import queue
+import requests
+import shutil
+import subprocess
+from azure.core.pipeline.transport import RequestsTransport
+from azure.storage.blob import (
+    BlobServiceClient,
+    BlobType,
+    ContainerSasPermissions,
+    ContentSettings,
+    generate_container_sas,
+)
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
+from datetime import datetime, timedelta, timezone
 from dotenv import load_dotenv
 from pathlib import Path
+from typing import Iterator
+from requests.adapters import HTTPAdapter
 
 load_dotenv()
 
@@ -24,6 +44,11 @@ def _get_upload_logger(name: str, log_file: str) -> logging.Logger:
 
     Uses the same pattern as get_logger() in base_transformer.py
     but avoids logging.basicConfig() which pollutes the root logger.
+
+    Upload threads only enqueue records (QueueHandler); a QueueListener
+    thread writes them to the file and console handlers, so no worker
+    waits on the handlers' locks or on log I/O. The listener is stopped
+    (and the queue drained) at interpreter exit.
     """
     logger = logging.getLogger(name)
     logger.setLevel(logging.INFO)
@@ -35,11 +60,15 @@ def _get_upload_logger(name: str, log_file: str) -> logging.Logger:
 
     fh = logging.FileHandler(LOG_DIR / log_file, mode="w")
     fh.setFormatter(formatter)
-    logger.addHandler(fh)
 
     sh = logging.StreamHandler()
     sh.setFormatter(formatter)
-    logger.addHandler(sh)
+
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, fh, sh, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
     return logger
 
@@ -58,8 +87,28 @@ class BlobUploader:
         container_name: Azure Blob container name
         file_glob:      Glob pattern for scanning (e.g. "*.csv", "*.parquet")
         log_file:       Log filename (e.g. "upload_bronze.log")
+
+    Files are uploaded concurrently by up to *max_workers* threads (the
+    work is network-bound; the SDK releases the GIL in its socket calls),
+    and each file's blocks are staged over *max_concurrency* connections.
+    All threads share one BlobServiceClient whose HTTP connection pool
+    holds max_workers x max_concurrency connections, so neither level of
+    parallelism queues for a connection.
+
+    Files whose size and MD5 match the existing blob are skipped; uploads
+    store the MD5 as Content-MD5 so the next run can compare without
+    downloading anything.
+
+    If the azcopy CLI is on PATH (and the connection string carries an
+    account key), run() mirrors the folder with `azcopy sync` instead,
+    which diffs by MD5 and parallelises block uploads natively. The SDK
+    path is the fallback when azcopy is missing or fails.
     """
 
+    max_workers = 16         # concurrent file uploads in run()
+    max_concurrency = 8      # parallel block uploads within one file
+    use_azcopy = True        # prefer `azcopy sync` when it is installed
+
     def __init__(self, container_name: str, file_glob: str, log_file: str):
         self.container_name = container_name
         self.file_glob = file_glob
@@ -70,27 +119,62 @@ class BlobUploader:
             self.logger.critical("AZURE_STORAGE_CONNECTION_STRING is not set in .env")
             raise ValueError("Missing AZURE_STORAGE_CONNECTION_STRING environment variable")
 
-        self.client = BlobServiceClient.from_connection_string(connect_str)
+        self.client = BlobServiceClient.from_connection_string(
+            connect_str,
+            max_block_size=4 * 1024 * 1024,
+            max_single_put_size=64 * 1024 * 1024,
+            transport=RequestsTransport(session=self._http_session(), connection_timeout=60),
+        )
         self.container_client = self.client.get_container_client(container_name)
 
         self.logger.info(f"[INIT] BlobUploader initialized -> Container: {container_name}")
 
-    def scan_folder(self, folder_path: str) -> list[Path]:
-        """Recursively scan *folder_path* for files matching *self.file_glob*."""
+    def _http_session(self) -> requests.Session:
+        """requests session with one pooled connection per concurrent block upload."""
+        pool_size = self.max_workers * self.max_concurrency
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def scan_folder(self, folder_path: str) -> Iterator[Path]:
+        """Recursively yield files in *folder_path* matching *self.file_glob*.
+
+        Lazy, so uploads can start while the walk is still running.
+        """
         folder = Path(folder_path)
 
         if not folder.exists():
             self.logger.error(f"[ERROR] Folder does not exist: {folder}")
-            return []
+            return
 
-        files = list(folder.rglob(self.file_glob))
-        self.logger.info(f"[SCAN] Found {len(files)} {self.file_glob} file(s) in: {folder}")
-        return files
+        self.logger.info(f"[SCAN] Scanning for {self.file_glob} file(s) in: {folder}")
+        yield from folder.rglob(self.file_glob)
 
-    def upload_file(self, file_path: Path, base_folder: Path) -> bool:
+    def _remote_blobs(self) -> dict[str, tuple[int, bytes]]:
+        """Size and Content-MD5 of every blob in the container (one listing call)."""
+        try:
+            remote = {
+                blob.name: (blob.size, bytes(blob.content_settings.content_md5 or b""))
+                for blob in self.container_client.list_blobs()
+            }
+        except Exception as e:
+            self.logger.warning(f"[LIST] Could not list existing blobs, uploading all -> {e}")
+            return {}
+
+        self.logger.info(f"[LIST] {len(remote)} existing blob(s) in: {self.container_name}")
+        return remote
+
+    def upload_file(self, file_path: Path, base_folder: Path, remote: dict = None) -> bool:
         """Upload a single file to the container.
 
         Blob name is derived from the relative path to *base_folder*.
+        The upload is skipped if *remote* (see _remote_blobs) lists a blob
+        of that name with the same size and MD5.
+
+        The MD5 is computed from a read-only memory map of the file, so
+        hashing copies nothing; the upload itself reads the file object.
 
         TODO (future):
         - Replace folder name (e.g. 'actual') with current date (YYYY-MM-DD)
@@ -99,30 +183,107 @@ class BlobUploader:
         blob_name = str(file_path.relative_to(base_folder))
 
         try:
+            size = file_path.stat().st_size
+
             with open(file_path, "rb") as f:
-                self.container_client.upload_blob(blob_name, f, overwrite=True)
+                # An empty file cannot be mapped
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else nullcontext(b"") as data:
+                    digest = hashlib.md5(data).digest()
+                if (remote or {}).get(blob_name) == (size, digest):
+                    self.logger.info(f"[SKIP] Unchanged: {blob_name}")
+                    return True
+
+                self.container_client.upload_blob(
+                    blob_name,
+                    f,
+                    blob_type=BlobType.BLOCKBLOB,
+                    length=size,
+                    overwrite=True,
+                    max_concurrency=self.max_concurrency,
+                    content_settings=ContentSettings(content_md5=digest),
+                )
             self.logger.info(f"[OK] Uploaded: {blob_name}")
             return True
         except Exception as e:
             self.logger.error(f"[FAIL] Upload failed: {blob_name} -> {e}")
             return False
 
+    def _container_sas_url(self) -> str:
+        """Container URL with a 2-hour SAS token signed by the account key."""
+        sas = generate_container_sas(
+            account_name=self.client.account_name,
+            container_name=self.container_name,
+            account_key=self.client.credential.account_key,
+            permission=ContainerSasPermissions(read=True, write=True, create=True, list=True),
+            expiry=datetime.now(timezone.utc) + timedelta(hours=2),
+        )
+        return f"{self.container_client.url}?{sas}"
+
+    def _azcopy_sync(self, folder: Path) -> bool:
+        """Mirror *folder* into the container with `azcopy sync`.
+
+        Returns:
+            True if azcopy ran and succeeded, False if the SDK path should run.
+        """
+        azcopy = shutil.which("azcopy")
+        if not self.use_azcopy or not azcopy:
+            return False
+        if not folder.exists():
+            self.logger.error(f"[ERROR] Folder does not exist: {folder}")
+            return True
+        if not getattr(self.client.credential, "account_key", None):
+            self.logger.info("[AZCOPY] No account key to sign a SAS token -> using the SDK")
+            return False
+
+        self.logger.info(f"[AZCOPY] Syncing {self.file_glob} file(s) from: {folder}")
+        cmd = [
+            azcopy, "sync", str(folder), self._container_sas_url(),
+            "--recursive", f"--include-pattern={self.file_glob}",
+            "--compare-hash=MD5", "--put-md5",
+        ]
+        with subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+        ) as proc:
+            for line in proc.stdout:
+                if line.strip():
+                    self.logger.info(f"[AZCOPY] {line.rstrip()}")
+
+        if proc.returncode != 0:
+            self.logger.error(f"[AZCOPY] azcopy sync failed (exit {proc.returncode}) -> using the SDK")
+            return False
+
+        self.logger.info("[SUMMARY] azcopy sync completed")
+        return True
+
     def run(self, folder_path: str) -> None:
-        """Scan folder and upload all matching files."""
-        base_folder = Path(folder_path)
-        files = self.scan_folder(folder_path)
+        """Scan folder and upload all matching files.
 
-        total = len(files)
+        Uses `azcopy sync` when available (see _azcopy_sync). Otherwise each
+        file is submitted to the thread pool as soon as the scan finds it.
+        """
+        base_folder = Path(folder_path)
         success = 0
         failed = 0
 
-        self.logger.info(f"[RUN] Start upload run -> {total} file(s) from: {base_folder}")
-
-        for file_path in files:
-            if self.upload_file(file_path, base_folder):
-                success += 1
-            else:
-                failed += 1
+        self.logger.info(f"[RUN] Start upload run from: {base_folder}")
+
+        if self._azcopy_sync(base_folder):
+            return
+
+        remote = self._remote_blobs()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(self.upload_file, file_path, base_folder, remote)
+                for file_path in self.scan_folder(folder_path)
+            ]
+            for future in as_completed(futures):
+                if future.result():
+                    success += 1
+                else:
+                    failed += 1
+
+        total = len(futures)
+        self.logger.info(f"[SCAN] Found {total} {self.file_glob} file(s) in: {base_folder}")
 
         self.logger.info("[SUMMARY] UPLOAD SUMMARY")
         self.logger.info(f"[SUMMARY] Successful: {success}/{total}")
@@ -3,7 +3,11 @@ Data Splitter for WWI Lakehouse Project
 Splits data by date columns and years for incremental ingestion
 """
 
+import multiprocessing
+import os
+import re
 import polars as pl
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional
@@ -14,6 +18,14 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _process_table_worker(raw_dir: str, bronze_dir: str, output_format: str,
+                          table_name: str, start_year: int, end_year: int,
+                          year_range_label: str) -> bool:
+    """Process-pool entry point: split one table in a fresh DataSplitter"""
+    splitter = DataSplitter(raw_dir, bronze_dir, output_format)
+    return splitter.process_table(table_name, start_year, end_year, year_range_label)
+
+
 class DataSplitter:
     """
     Splits WWI data by dates and years.
@@ -35,18 +47,45 @@ class DataSplitter:
         'sales.customer': 'ValidFrom',
     }
     
-    def __init__(self, raw_dir: str = 'data/raw', bronze_dir: str = 'data/bronze'):
+    # Supported date layouts: (pattern of a sample value, strptime format),
+    # compiled once at import
+    DATE_FORMATS = [
+        (re.compile(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d+'), '%Y-%m-%d %H:%M:%S%.f'),  # 2013-04-15 12:34:56.123
+        (re.compile(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}'), '%Y-%m-%d %H:%M:%S'),           # 2013-04-15 12:34:56
+        (re.compile(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+'), '%Y-%m-%dT%H:%M:%S%.f'),  # 2013-04-15T12:34:56.123
+        (re.compile(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}'), '%Y-%m-%dT%H:%M:%S'),           # 2013-04-15T12:34:56
+        (re.compile(r'\d{4}-\d{2}-\d{2}'), '%Y-%m-%d'),                                      # 2013-04-15
+        (re.compile(r'\d{2}/\d{2}/\d{4}'), '%d/%m/%Y'),                                      # 15/04/2013
+    ]
+    
+    # Rows read to sniff a date column's format before the streaming split
+    DATE_SAMPLE_ROWS = 10_000
+    
+    # Parquet output settings (output_format='parquet');
+    # statistics per row group let year-range filters skip row groups
+    PARQUET_OPTIONS = dict(compression='zstd', compression_level=3,
+                           row_group_size=500_000, statistics=True)
+    
+    def __init__(self, raw_dir: str = 'data/raw', bronze_dir: str = 'data/bronze',
+                 output_format: str = 'csv'):
         """
         Initialize DataSplitter
         
         Args:
             raw_dir: Directory with raw CSVs
             bronze_dir: Target directory for split data
+            output_format: 'csv' (default) or 'parquet' (zstd, with row-group statistics)
         """
+        if output_format not in ('csv', 'parquet'):
+            raise ValueError(f"Unsupported output_format: {output_format}")
+        self.output_format = output_format
         self.raw_path = Path(raw_dir)
         self.bronze_path = Path(bronze_dir)
         self.raw_path.mkdir(parents=True, exist_ok=True)
         self.bronze_path.mkdir(parents=True, exist_ok=True)
+        
+        # Detected delimiter per (file, candidates); every file is sniffed once
+        self._delimiter_cache: Dict[tuple, str] = {}
     
     def get_csv_filename(self, table_name: str) -> str:
         """Convert table name to CSV filename"""
@@ -64,15 +103,21 @@ class DataSplitter:
         Returns:
             Detected delimiter
         """
+        cache_key = (filepath, tuple(delimiters))
+        if cache_key in self._delimiter_cache:
+            return self._delimiter_cache[cache_key]
+        
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                header = f.readline()
+            # Header row as raw bytes: no UTF-8 decoding needed to count ASCII delimiters
+            with open(filepath, 'rb') as f:
+                header = f.read(4096).split(b'\n', 1)[0]
             
             # Count occurrences of each delimiter
-            delimiter_counts = {delim: header.count(delim) for delim in delimiters}
+            delimiter_counts = {delim: header.count(delim.encode()) for delim in delimiters}
             detected = max(delimiter_counts, key=delimiter_counts.get)
             
             logger.debug(f"{filepath.name}: detected delimiter '{detected}' ({delimiter_counts})")
+            self._delimiter_cache[cache_key] = detected
             return detected
         except Exception as e:
             logger.warning(f"Error detecting delimiter for {filepath}: {e}. Using comma.")
@@ -90,13 +135,36 @@ class DataSplitter:
             # Auto-detect delimiter
             delimiter = self.detect_delimiter(csv_file)
             
-            df = pl.read_csv(csv_file, truncate_ragged_lines=True, separator=delimiter, infer_schema_length=10000)
+            df = self.scan_table(table_name).collect()
             logger.info(f"Loaded {table_name}: {len(df)} rows, {len(df.columns)} columns (delimiter: '{delimiter}')")
             return df
         except Exception as e:
             logger.error(f"Error loading {table_name}: {e}")
             return None
     
+    def scan_table(self, table_name: str) -> Optional[pl.LazyFrame]:
+        """Lazily scan a table's CSV with auto-detected delimiter (nothing is read yet)"""
+        csv_file = self.raw_path / self.get_csv_filename(table_name)
+        
+        if not csv_file.exists():
+            logger.warning(f"File not found: {csv_file}")
+            return None
+        
+        delimiter = self.detect_delimiter(csv_file)
+        return pl.scan_csv(csv_file, truncate_ragged_lines=True, separator=delimiter, infer_schema_length=10000)
+    
+    def date_formats(self, sample) -> List[str]:
+        """All supported date formats, the one matching the sample value first"""
+        sniffed = next(
+            (fmt for pattern, fmt in self.DATE_FORMATS if pattern.fullmatch(str(sample))),
+            None,
+        )
+        formats = [fmt for _, fmt in self.DATE_FORMATS]
+        if sniffed:
+            formats.remove(sniffed)
+            formats.insert(0, sniffed)
+        return formats
+    
     def parse_date_column(self, df: pl.DataFrame, date_col: str) -> pl.DataFrame:
         """Parse date column to DateTime format"""
         if date_col not in df.columns:
@@ -104,23 +172,20 @@ class DataSplitter:
             return df
         
         try:
-            # Try different formats
-            formats = [
-                '%Y-%m-%d %H:%M:%S%.f',  # 2013-04-15 12:34:56.123
-                '%Y-%m-%d %H:%M:%S',     # 2013-04-15 12:34:56
-                '%Y-%m-%d',               # 2013-04-15
-                '%d/%m/%Y',               # 15/04/2013
-            ]
+            # Sniff the format from the first non-null value and parse once;
+            # the other formats are only tried if that parse fails.
+            sample = df.select(pl.col(date_col).drop_nulls().first()).item()
+            if sample is None:
+                logger.warning(f"Date column '{date_col}' is empty")
+                return df
             
-            for fmt in formats:
+            for fmt in self.date_formats(sample):
                 try:
-                    df = df.with_columns(
+                    return df.with_columns(
                         pl.col(date_col).str.to_datetime(fmt).alias(f"{date_col}_parsed")
                     )
-                    if f"{date_col}_parsed" in df.columns:
-                        return df
-                except:
-                    continue
+                except pl.exceptions.PolarsError:
+                    logger.debug(f"'{date_col}' does not match {fmt}")
             
             logger.warning(f"Could not parse '{date_col}' with any format")
             return df
@@ -147,25 +212,66 @@ class DataSplitter:
         
         return df_filtered
     
-    def save_table(self, df: pl.DataFrame, table_name: str, folder: str) -> None:
-        """Save table as CSV to target folder"""
-        # Create target directory: data/bronze/{folder}/
+    def output_file(self, table_name: str, folder: str) -> Path:
+        """Target file data/bronze/{folder}/{table_name}.{output_format} (creates the folder)"""
         target_dir = self.bronze_path / folder
         target_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Save file with table name
-        output_file = target_dir / f"{table_name}.csv"
-        df.write_csv(output_file)
+        return target_dir / f"{table_name}.{self.output_format}"
+    
+    def save_table(self, df: pl.DataFrame, table_name: str, folder: str) -> None:
+        """Save table as CSV or Parquet (see output_format) to target folder"""
+        output_file = self.output_file(table_name, folder)
+        if self.output_format == 'parquet':
+            df.write_parquet(output_file, **self.PARQUET_OPTIONS)
+        else:
+            df.write_csv(output_file)
         logger.info(f"Saved: {output_file} ({len(df)} rows)")
     
+    def sink_table(self, lf: pl.LazyFrame, table_name: str, folder: str,
+                   keep_empty: bool = False) -> bool:
+        """
+        Stream a lazy query into the target folder without materializing it
+        
+        Returns:
+            Whether any rows were written (without keep_empty, the file is
+            removed again if there are none)
+        """
+        output_file = self.output_file(table_name, folder)
+        try:
+            if self.output_format == 'parquet':
+                lf.sink_parquet(output_file, **self.PARQUET_OPTIONS)
+                scan = pl.scan_parquet(output_file)
+            else:
+                lf.sink_csv(output_file)
+                scan = pl.scan_csv(output_file)
+            # Only the first row is read back: is the output empty?
+            has_rows = scan.limit(1).collect().height > 0
+        except pl.exceptions.PolarsError:
+            # Do not leave a partially written file behind
+            output_file.unlink(missing_ok=True)
+            raise
+        
+        if not has_rows and not keep_empty:
+            output_file.unlink()
+        else:
+            logger.info(f"Saved: {output_file}")
+        return has_rows
+    
     def process_table(self, table_name: str, start_year: int, end_year: int, 
                      year_range_label: str) -> bool:
-        """Process a single table"""
+        """
+        Process a single table
+        
+        The CSV is scanned lazily and parsed, filtered and written in one
+        streaming pass, so only the rows in the year range are ever held
+        in memory. Falls back to the eager load/parse/filter path if the
+        sniffed date format does not fit every row.
+        """
         logger.info(f"Processing: {table_name}")
         
-        # Load table
-        df = self.load_table(table_name)
-        if df is None:
+        # Scan table
+        lf = self.scan_table(table_name)
+        if lf is None:
             return False
         
         # Get date column from configuration
@@ -177,7 +283,31 @@ class DataSplitter:
         logger.info(f"Date column: {date_col}")
         logger.info(f"Filter: {start_year}-{end_year}")
         
-        # Parse and filter by year
+        if date_col in lf.collect_schema().names():
+            # Sniff the format from the first rows only (bounded read)
+            sample = lf.head(self.DATE_SAMPLE_ROWS).select(
+                pl.col(date_col).drop_nulls().first()
+            ).collect().item()
+            if sample is not None:
+                parsed = f"{date_col}_parsed"
+                query = lf.with_columns(
+                    pl.col(date_col).str.to_datetime(self.date_formats(sample)[0]).alias(parsed)
+                ).filter(
+                    pl.col(parsed).dt.year().is_between(start_year, end_year)
+                )
+                try:
+                    if not self.sink_table(query, table_name, year_range_label):
+                        logger.warning(f"No data found for {start_year}-{end_year}")
+                        return False
+                    return True
+                except pl.exceptions.PolarsError as e:
+                    logger.debug(f"Streaming split of {table_name} failed ({e}), loading eagerly")
+        
+        # Eager fallback: load, parse (trying every format) and filter by year
+        df = self.load_table(table_name)
+        if df is None:
+            return False
+        
         df_parsed = self.parse_date_column(df, date_col)
         df_filtered = self.split_by_year_range(df_parsed, date_col, start_year, end_year)
         
@@ -189,47 +319,56 @@ class DataSplitter:
         self.save_table(df_filtered, table_name, year_range_label)
         return True
     
+    def process_dimension_table(self, table_name: str, year_range_label: str) -> bool:
+        """Copy a single dimension table as-is to the year folder"""
+        logger.info(f"Loading dimension table: {table_name}")
+        
+        try:
+            # Auto-detect delimiter and load
+            df = self.scan_table(table_name).collect()
+            
+            logger.info(f"  Loaded {table_name}: {len(df)} rows, {len(df.columns)} columns")
+            
+            # Save directly to year folder without filtering
+            self.save_table(df, table_name, year_range_label)
+            return True
+        except Exception as e:
+            logger.error(f"  ❌ {table_name} - Error: {e}")
+            return False
+    
     def process_dimension_tables(self, year_range_label: str = "actual") -> None:
         """
         Process tables that are NOT date-partitioned (dimension tables).
         These are copied as-is to the year folder without filtering.
+        
+        The files are independent and Polars releases the GIL while parsing
+        and writing, so they are copied by a thread pool.
         """
         logger.info(f"\nProcessing dimension/reference tables (no date filtering)...")
         
-        # Get all CSV files from raw directory
-        all_csv_files = list(self.raw_path.glob('*.csv'))
-        
-        # Get table names that ARE configured for date splitting
+        # Table names of all raw CSVs (file name without .csv extension),
+        # minus the tables configured for date splitting
         date_split_tables = set(self.TABLE_CONFIG.keys())
+        table_names = [
+            csv_file.stem for csv_file in self.raw_path.glob('*.csv')
+            if csv_file.stem not in date_split_tables
+        ]
         
         processed = 0
         failed = 0
         
-        for csv_file in all_csv_files:
-            # Extract table name (remove .csv extension)
-            table_name = csv_file.stem
-            
-            # Skip if this table is configured for date splitting
-            if table_name in date_split_tables:
-                continue
-            
-            logger.info(f"Loading dimension table: {table_name}")
-            
-            try:
-                # Auto-detect delimiter and load
-                delimiter = self.detect_delimiter(csv_file)
-                df = pl.read_csv(csv_file, truncate_ragged_lines=True, separator=delimiter, infer_schema_length=10000)
-                
-                logger.info(f"  Loaded {table_name}: {len(df)} rows, {len(df.columns)} columns")
-                
-                # Save directly to year folder without filtering
-                self.save_table(df, table_name, year_range_label)
-                processed += 1
-                logger.info(f"  ✅ {table_name}")
-                
-            except Exception as e:
-                logger.error(f"  ❌ {table_name} - Error: {e}")
-                failed += 1
+        max_workers = min(8, os.cpu_count() or 1, len(table_names) or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(
+                lambda table_name: self.process_dimension_table(table_name, year_range_label),
+                table_names,
+            )
+            for table_name, ok in zip(table_names, results):
+                if ok:
+                    processed += 1
+                    logger.info(f"  ✅ {table_name}")
+                else:
+                    failed += 1
         
         logger.info(f"Dimension tables processed: {processed} successful, {failed} failed\n")
     
@@ -243,9 +382,33 @@ class DataSplitter:
         processed = 0
         failed = 0
         
-        for table_name in self.TABLE_CONFIG.keys():
+        # The tables are independent: split them in parallel worker processes,
+        # each with its share of the cores for Polars' thread pool.
+        # POLARS_MAX_THREADS is read when a worker imports polars, so it is
+        # set only while the pool spawns its workers.
+        cpu_count = os.cpu_count() or 1
+        max_workers = min(cpu_count, len(self.TABLE_CONFIG))
+        polars_threads = os.environ.get('POLARS_MAX_THREADS')
+        os.environ['POLARS_MAX_THREADS'] = str(max(1, cpu_count // max_workers))
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers,
+                                     mp_context=multiprocessing.get_context('spawn')) as executor:
+                futures = {
+                    table_name: executor.submit(
+                        _process_table_worker, str(self.raw_path), str(self.bronze_path),
+                        self.output_format, table_name, start_year, end_year, year_range_label,
+                    )
+                    for table_name in self.TABLE_CONFIG.keys()
+                }
+        finally:
+            if polars_threads is None:
+                del os.environ['POLARS_MAX_THREADS']
+            else:
+                os.environ['POLARS_MAX_THREADS'] = polars_threads
+        
+        for table_name, future in futures.items():
             try:
-                if self.process_table(table_name, start_year, end_year, year_range_label):
+                if future.result():
                     processed += 1
                     logger.info(f"  ✅ {table_name}")
                 else:
@@ -270,21 +433,26 @@ class DataSplitter:
         logger.info("=" * 60 + "\n")
     
     def create_upcoming_placeholder(self) -> None:
-        """Save all unfiltered tables to upcoming folder"""
+        """
+        Save all unfiltered tables to upcoming folder
+        
+        Each table is streamed from the raw CSV straight into its target
+        file, so no table is held in memory as a whole.
+        """
         logger.info("\nProcessing upcoming tables (unfiltered)...")
         
         saved_count = 0
         failed_count = 0
         
         for table_name in self.TABLE_CONFIG.keys():
-            df = self.load_table(table_name)
-            if df is None:
+            lf = self.scan_table(table_name)
+            if lf is None:
                 failed_count += 1
                 logger.warning(f"  ❌ {table_name}")
                 continue
             
             try:
-                self.save_table(df, table_name, "upcoming")
+                self.sink_table(lf, table_name, "upcoming", keep_empty=True)
                 saved_count += 1
                 logger.info(f"  ✅ {table_name}")
             except Exception as e: